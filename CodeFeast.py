@@ -4,9 +4,9 @@ from email.mime.multipart import MIMEMultipart
 from email.mime.application import MIMEApplication
 import os
 import sys
-import time
 import csv
 from dotenv import load_dotenv
+from SenderControl import SenderControl
 
 # Load environment variables
 load_dotenv()
@@ -21,6 +21,8 @@ class EmailSender:
         self.participants_file = os.getenv('PARTICIPANTS_FILE', 'data/participants.csv')
         self.delay = int(os.getenv('DELAY_BETWEEN_EMAILS', '30'))
         self.organization_name = os.getenv('ORGANIZATION_NAME', 'Programmers Club')
+        self.control_port = os.getenv('CONTROL_PORT', '')
+        self.control = SenderControl(self.delay)
         
     
     def generate_achievement_badge(self):
@@ -294,23 +296,45 @@ class EmailSender:
         success_count = 0
         total_count = len(participants_data)
 
+        # Start live control if a port is configured
+        self.control.start_run(total_count)
+        if self.control_port:
+            try:
+                self.control.start_server(int(self.control_port))
+            except (ValueError, OSError) as e:
+                print(f"[ERROR] Could not start control server on port {self.control_port}: {e}")
+                return 0
+
         print(f"Sending emails to {total_count} participants...")
 
-        for i, participant in enumerate(participants_data):
-            name = participant.get('name', '')
-            email = participant.get('email', '')
-            certificate_path = participant.get('certificate_path')
-            if not email:
-                print(f"[SKIP] Missing email for {name}, skipping.")
-                continue
+        try:
+            for i, participant in enumerate(participants_data):
+                # Pause or drain requested from the control server
+                self.control.wait_if_paused()
+                if self.control.should_stop():
+                    unsent = sum(1 for row in participants_data[i:] if row.get('email'))
+                    print(f"[DRAIN] Stopping with {unsent} emails left unsent")
+                    break
+
+                name = participant.get('name', '')
+                email = participant.get('email', '')
+                certificate_path = participant.get('certificate_path')
+                if not email:
+                    print(f"[SKIP] Missing email for {name}, skipping.")
+                    self.control.record_skip()
+                    continue
 
-            if self.send_email(name, email, certificate_path):
-                success_count += 1
+                sent = self.send_email(name, email, certificate_path)
+                self.control.record_result(sent)
+                if sent:
+                    success_count += 1
 
-            # Delay between emails
-            if i < total_count - 1:
-                print(f"Waiting {self.delay} seconds...")
-                time.sleep(self.delay)
+                # Delay between emails (can be changed while running)
+                if i < total_count - 1:
+                    print(f"Waiting {self.control.delay} seconds...")
+                    self.control.wait_between_emails()
+        finally:
+            self.control.stop_server()
 
         print(f"\nSent {success_count}/{total_count} emails successfully!")
         return success_count
@@ -4,9 +4,9 @@ from email.mime.multipart import MIMEMultipart
 from email.mime.application import MIMEApplication
 import os
 import sys
-import time
 import json
 from dotenv import load_dotenv
+from SenderControl import SenderControl
 
 # Load environment variables
 load_dotenv()
@@ -21,6 +21,8 @@ class OrganizerEmailSender:
         self.organizers_file = os.getenv('ORGANIZERS_FILE', 'data/organizers.json')
         self.delay = int(os.getenv('DELAY_BETWEEN_EMAILS', '30'))
         self.organization_name = os.getenv('ORGANIZATION_NAME', 'Programmers Club')
+        self.control_port = os.getenv('CONTROL_PORT', '')
+        self.control = SenderControl(self.delay)
         
     
     def generate_organizer_content(self, name):
@@ -240,23 +242,45 @@ class OrganizerEmailSender:
         success_count = 0
         total_count = len(organizers_data)
 
+        # Start live control if a port is configured
+        self.control.start_run(total_count)
+        if self.control_port:
+            try:
+                self.control.start_server(int(self.control_port))
+            except (ValueError, OSError) as e:
+                print(f"[ERROR] Could not start control server on port {self.control_port}: {e}")
+                return 0
+
         print(f"Sending emails to {total_count} organizers...")
 
-        for i, organizer in enumerate(organizers_data):
-            name = organizer.get('name', '')
-            email = organizer.get('email', '')
-            certificate_path = organizer.get('certificate_path')
-            if not email:
-                print(f"[SKIP] Missing email for {name}, skipping.")
-                continue
+        try:
+            for i, organizer in enumerate(organizers_data):
+                # Pause or drain requested from the control server
+                self.control.wait_if_paused()
+                if self.control.should_stop():
+                    unsent = sum(1 for row in organizers_data[i:] if row.get('email'))
+                    print(f"[DRAIN] Stopping with {unsent} emails left unsent")
+                    break
+
+                name = organizer.get('name', '')
+                email = organizer.get('email', '')
+                certificate_path = organizer.get('certificate_path')
+                if not email:
+                    print(f"[SKIP] Missing email for {name}, skipping.")
+                    self.control.record_skip()
+                    continue
 
-            if self.send_email(name, email, certificate_path):
-                success_count += 1
+                sent = self.send_email(name, email, certificate_path)
+                self.control.record_result(sent)
+                if sent:
+                    success_count += 1
 
-            # Delay between emails
-            if i < total_count - 1:
-                print(f"Waiting {self.delay} seconds...")
-                time.sleep(self.delay)
+                # Delay between emails (can be changed while running)
+                if i < total_count - 1:
+                    print(f"Waiting {self.control.delay} seconds...")
+                    self.control.wait_between_emails()
+        finally:
+            self.control.stop_server()
 
         print(f"\nSent {success_count}/{total_count} emails successfully!")
         return success_count
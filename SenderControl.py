@@ -0,0 +1,228 @@
+import json
+import math
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+# Largest delay accepted from the control server (1 hour)
+MAX_DELAY = 3600
+
+
+# Live control for a running sender (pause, resume, drain, delay, stats)
+class SenderControl:
+    def __init__(self, delay):
+        # Simple shared state, guarded by a lock
+        self.lock = threading.Lock()
+        self.delay = delay
+        self.running = threading.Event()
+        self.running.set()
+        self.draining = False
+        self.total_count = 0
+        self.processed_count = 0
+        self.success_count = 0
+        self.failed_count = 0
+        self.skipped_count = 0
+        self.start_time = None
+        self.paused_time = 0.0
+        self.pause_started = None
+        self.waited_time = 0.0
+        self.server = None
+
+    def start_run(self, total_count):
+        """Reset counters at the start of a run"""
+        with self.lock:
+            self.total_count = total_count
+            self.processed_count = 0
+            self.success_count = 0
+            self.failed_count = 0
+            self.skipped_count = 0
+            self.start_time = time.time()
+            self.paused_time = 0.0
+            self.pause_started = None
+            self.waited_time = 0.0
+            self.draining = False
+        self.running.set()
+
+    def record_result(self, sent):
+        """Record the outcome of one recipient"""
+        with self.lock:
+            self.processed_count += 1
+            if sent:
+                self.success_count += 1
+            else:
+                self.failed_count += 1
+
+    def record_skip(self):
+        """Record a recipient skipped before sending"""
+        with self.lock:
+            self.processed_count += 1
+            self.skipped_count += 1
+
+    def set_delay(self, delay):
+        """Change the delay between emails"""
+        with self.lock:
+            self.delay = delay
+        print(f"[CONTROL] Delay set to {delay} seconds")
+
+    def pause(self):
+        """Pause sending before the next email"""
+        with self.lock:
+            if self.running.is_set() and not self.draining:
+                self.pause_started = time.time()
+                self.running.clear()
+        print("[CONTROL] Paused")
+
+    def resume(self):
+        """Resume sending"""
+        with self.lock:
+            self._end_pause()
+        print("[CONTROL] Resumed")
+
+    def drain(self):
+        """Stop after the email currently being sent"""
+        with self.lock:
+            self.draining = True
+            # Wake up a paused sender so it can finish
+            self._end_pause()
+        print("[CONTROL] Draining, no new emails will be sent")
+
+    def _end_pause(self):
+        # Caller holds the lock
+        if self.pause_started is not None:
+            self.paused_time += time.time() - self.pause_started
+            self.pause_started = None
+        self.running.set()
+
+    def should_stop(self):
+        """Check if a drain was requested"""
+        with self.lock:
+            return self.draining
+
+    def wait_if_paused(self):
+        """Block while paused"""
+        if not self.running.is_set():
+            print("Paused, waiting for resume...")
+            self.running.wait()
+
+    def wait_between_emails(self):
+        """Sleep for the current delay, picking up changes while waiting"""
+        waited = 0.0
+        while not self.should_stop():
+            # A pause during the wait holds it until resume
+            self.wait_if_paused()
+            if self.should_stop():
+                break
+            with self.lock:
+                remaining = self.delay - waited
+            if remaining <= 0:
+                break
+            step = min(remaining, 1.0)
+            time.sleep(step)
+            waited += step
+            with self.lock:
+                self.waited_time += step
+
+    def get_stats(self):
+        """Current progress, throughput and ETA"""
+        with self.lock:
+            now = time.time()
+            elapsed = 0.0
+            if self.start_time:
+                # Leave paused time out so throughput and ETA stay accurate
+                paused = self.paused_time
+                if self.pause_started is not None:
+                    paused += now - self.pause_started
+                elapsed = max(now - self.start_time - paused, 0.0)
+            remaining = max(self.total_count - self.processed_count, 0)
+            # Skipped rows cost no time, so only count real send attempts
+            attempted = self.success_count + self.failed_count
+            throughput = attempted / elapsed * 60 if elapsed > 0 else 0.0
+            if attempted:
+                # Average send time plus the current delay, so /delay changes show up at once
+                send_time = max(elapsed - self.waited_time, 0.0) / attempted
+                eta = remaining * send_time + max(remaining - 1, 0) * self.delay
+            elif remaining:
+                eta = None
+            else:
+                eta = 0.0
+            if self.draining:
+                state = 'draining'
+            elif not self.running.is_set():
+                state = 'paused'
+            else:
+                state = 'running'
+            return {
+                'state': state,
+                'delay': self.delay,
+                'total': self.total_count,
+                'processed': self.processed_count,
+                'sent': self.success_count,
+                'failed': self.failed_count,
+                'skipped': self.skipped_count,
+                'queue_depth': remaining,
+                'elapsed_seconds': round(elapsed, 1),
+                'emails_per_minute': round(throughput, 2),
+                'eta_seconds': round(eta, 1) if eta is not None else None,
+            }
+
+    def start_server(self, port, host='127.0.0.1'):
+        """Serve the control endpoints on localhost in a background thread"""
+        if not 0 <= port <= 65535:
+            raise ValueError(f"port must be 0-65535, got {port}")
+        control = self
+
+        class ControlHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if urlparse(self.path).path == '/stats':
+                    self.reply(200, control.get_stats())
+                else:
+                    self.reply(404, {'error': 'not found'})
+
+            def do_POST(self):
+                url = urlparse(self.path)
+                if url.path == '/pause':
+                    control.pause()
+                elif url.path == '/resume':
+                    control.resume()
+                elif url.path == '/drain':
+                    control.drain()
+                elif url.path == '/delay':
+                    value = parse_qs(url.query).get('seconds', [''])[0]
+                    try:
+                        delay = float(value)
+                    except ValueError:
+                        self.reply(400, {'error': 'seconds must be a number'})
+                        return
+                    if not math.isfinite(delay) or not 0 <= delay <= MAX_DELAY:
+                        self.reply(400, {'error': f'seconds must be between 0 and {MAX_DELAY}'})
+                        return
+                    control.set_delay(delay)
+                else:
+                    self.reply(404, {'error': 'not found'})
+                    return
+                self.reply(200, control.get_stats())
+
+            def reply(self, status, body):
+                data = json.dumps(body).encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format, *args):
+                # Keep the sender output readable
+                pass
+
+        self.server = ThreadingHTTPServer((host, port), ControlHandler)
+        thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        thread.start()
+        print(f"[CONTROL] Listening on http://{host}:{self.server.server_address[1]}")
+
+    def stop_server(self):
+        """Shut down the control server"""
+        if self.server:
+            self.server.shutdown()
+            self.server.server_close()
+            self.server = None
@@ -0,0 +1,212 @@
+import contextlib
+import io
+import json
+import socket
+import threading
+import time
+import unittest
+import urllib.error
+import urllib.request
+
+from CodeFeast import EmailSender
+from Organizers import OrganizerEmailSender
+from SenderControl import SenderControl
+
+
+# Checks for the live control server (no SMTP needed)
+class SenderControlTest(unittest.TestCase):
+    def setUp(self):
+        self.control = SenderControl(0)
+        self.control.start_run(3)
+        self.control.start_server(0)
+        self.port = self.control.server.server_address[1]
+
+    def tearDown(self):
+        self.control.stop_server()
+
+    def request(self, path, method='GET'):
+        """Call the control server and return (status, body)"""
+        url = f"http://127.0.0.1:{self.port}{path}"
+        try:
+            with urllib.request.urlopen(urllib.request.Request(url, method=method)) as response:
+                return response.status, json.load(response)
+        except urllib.error.HTTPError as e:
+            return e.code, json.load(e)
+
+    def test_stats_shape(self):
+        status, stats = self.request('/stats')
+        self.assertEqual(status, 200)
+        self.assertEqual(set(stats), {
+            'state', 'delay', 'total', 'processed', 'sent', 'failed', 'skipped',
+            'queue_depth', 'elapsed_seconds', 'emails_per_minute', 'eta_seconds',
+        })
+        self.assertEqual(stats['state'], 'running')
+        self.assertEqual(stats['queue_depth'], 3)
+
+    def test_skip_is_not_a_failure(self):
+        self.control.record_result(True)
+        self.control.record_result(False)
+        self.control.record_skip()
+        stats = self.control.get_stats()
+        self.assertEqual((stats['sent'], stats['failed'], stats['skipped']), (1, 1, 1))
+        self.assertEqual(stats['queue_depth'], 0)
+
+    def test_skips_do_not_skew_rate(self):
+        self.control.record_skip()
+        self.control.record_skip()
+        stats = self.control.get_stats()
+        self.assertEqual(stats['emails_per_minute'], 0.0)
+        self.assertIsNone(stats['eta_seconds'])
+
+    def test_eta_follows_delay_changes(self):
+        self.control.record_result(True)
+        self.control.set_delay(30)
+        slow = self.control.get_stats()['eta_seconds']
+        self.control.set_delay(5)
+        fast = self.control.get_stats()['eta_seconds']
+        # Two recipients remain, so one delay is left in the ETA
+        self.assertAlmostEqual(slow - fast, 25, places=0)
+
+    def test_port_out_of_range(self):
+        for port in [-1, 70000]:
+            with self.assertRaises(ValueError):
+                SenderControl(0).start_server(port)
+
+    def test_delay_validation(self):
+        for value in ['nan', 'inf', '-inf', '-1', 'abc', '', '100000']:
+            status, _ = self.request(f'/delay?seconds={value}', 'POST')
+            self.assertEqual(status, 400, value)
+        self.assertEqual(self.control.delay, 0)
+
+        status, stats = self.request('/delay?seconds=5', 'POST')
+        self.assertEqual(status, 200)
+        self.assertEqual(stats['delay'], 5.0)
+
+    def test_pause_resume(self):
+        self.request('/pause', 'POST')
+        self.assertEqual(self.request('/stats')[1]['state'], 'paused')
+
+        done = threading.Event()
+        thread = threading.Thread(target=lambda: (self.control.wait_if_paused(), done.set()))
+        thread.start()
+        self.assertFalse(done.wait(0.2))
+
+        self.request('/resume', 'POST')
+        self.assertTrue(done.wait(2))
+        self.assertEqual(self.request('/stats')[1]['state'], 'running')
+
+    def test_pause_during_wait(self):
+        self.control.set_delay(0.2)
+        self.control.pause()
+        thread = threading.Thread(target=self.control.wait_between_emails)
+        thread.start()
+        thread.join(0.5)
+        self.assertTrue(thread.is_alive())
+
+        self.control.resume()
+        thread.join(2)
+        self.assertFalse(thread.is_alive())
+
+    def test_paused_time_not_in_elapsed(self):
+        self.control.pause()
+        time.sleep(0.3)
+        self.control.resume()
+        self.assertLess(self.control.get_stats()['elapsed_seconds'], 0.2)
+
+    def test_drain_wakes_paused_sender(self):
+        self.control.set_delay(60)
+        thread = threading.Thread(target=self.control.wait_between_emails)
+        thread.start()
+        self.request('/pause', 'POST')
+        status, stats = self.request('/drain', 'POST')
+        self.assertEqual(status, 200)
+        self.assertEqual(stats['state'], 'draining')
+        thread.join(3)
+        self.assertFalse(thread.is_alive())
+        self.assertTrue(self.control.should_stop())
+
+    def test_start_run_resets_drain_and_pause(self):
+        self.control.pause()
+        self.control.drain()
+        self.control.start_run(2)
+        self.assertFalse(self.control.should_stop())
+        self.assertEqual(self.control.get_stats()['state'], 'running')
+
+        self.control.pause()
+        self.control.start_run(2)
+        self.assertEqual(self.control.get_stats()['state'], 'running')
+
+
+# Checks for how each sender drives the control server
+class SenderWiringMixin:
+    sender_class = None
+
+    def setUp(self):
+        self.sender = self.sender_class()
+        self.sender.delay = 0
+        self.sender.control.delay = 0
+        self.sender.control_port = ''
+        self.sent = []
+        self.rows = [
+            {'name': 'Ada', 'email': 'ada@example.com'},
+            {'name': 'Bob', 'email': 'bob@example.com'},
+            {'name': 'No Email', 'email': ''},
+            {'name': 'Cy', 'email': 'cy@example.com'},
+        ]
+
+    def fake_send(self, name, email, certificate_path=None):
+        self.sent.append(email)
+        return True
+
+    def test_drain_stops_loop(self):
+        def send_then_drain(name, email, certificate_path=None):
+            self.fake_send(name, email)
+            if len(self.sent) == 2:
+                self.sender.control.drain()
+            return True
+
+        self.sender.send_email = send_then_drain
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            self.assertEqual(self.sender.send_all_emails(self.rows), 2)
+        self.assertEqual(self.sent, ['ada@example.com', 'bob@example.com'])
+        # The row without an email is not counted as unsent
+        self.assertIn('[DRAIN] Stopping with 1 emails left unsent', output.getvalue())
+
+    def test_server_stopped_when_send_raises(self):
+        def broken_send(name, email, certificate_path=None):
+            raise RuntimeError('boom')
+
+        self.sender.control_port = '0'
+        self.sender.send_email = broken_send
+        with self.assertRaises(RuntimeError):
+            self.sender.send_all_emails(self.rows)
+        self.assertIsNone(self.sender.control.server)
+
+    def test_bad_port_sends_nothing(self):
+        self.sender.send_email = self.fake_send
+        for port in ['abc', '70000', '-1']:
+            self.sender.control_port = port
+            self.assertEqual(self.sender.send_all_emails(self.rows), 0, port)
+        self.assertEqual(self.sent, [])
+
+    def test_busy_port_sends_nothing(self):
+        self.sender.send_email = self.fake_send
+        with socket.socket() as busy:
+            busy.bind(('127.0.0.1', 0))
+            busy.listen()
+            self.sender.control_port = str(busy.getsockname()[1])
+            self.assertEqual(self.sender.send_all_emails(self.rows), 0)
+        self.assertEqual(self.sent, [])
+
+
+class EmailSenderWiringTest(SenderWiringMixin, unittest.TestCase):
+    sender_class = EmailSender
+
+
+class OrganizerSenderWiringTest(SenderWiringMixin, unittest.TestCase):
+    sender_class = OrganizerEmailSender
+
+
+if __name__ == '__main__':
+    unittest.main()